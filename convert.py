@@ -1,12 +1,54 @@
-from openpyxl import Workbook
+from openpyxl import Workbook, load_workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font, Alignment
-from docx import Document
+from docx.oxml.ns import qn
+from docx.oxml.parser import element_class_lookup, parse_xml
+from docx.parts.styles import StylesPart
+from docx.styles.styles import Styles
+from docx.table import Table
+from docx.text.paragraph import Paragraph
+from lxml import etree
+import numpy as np
 import pandas as pd
+import json
 import os
 import re
-from typing import Dict, List, Tuple
+import zipfile
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
+from functools import lru_cache
+from itertools import repeat
+
+_NON_WORD_RE = re.compile(r'\W+')
+
+# Qualified tag names of the body elements copied to Excel
+_BODY_TAG = qn('w:body')
+_P_TAG = qn('w:p')
+_TBL_TAG = qn('w:tbl')
+
+# Shared styles for exported cells
+DEFAULT_FONT = Font(name='Calibri', size=11)
+BOLD_FONT = Font(bold=True)
+ITALIC_FONT = Font(italic=True)
+LEFT_WRAP = Alignment(horizontal='left', wrap_text=True)
+
+# Rows read from the sheet per chunk when generating a schema
+_CHUNK_SIZE = 50_000
+
+# Rows parsed to decide whether a text column holds dates
+_DATE_SAMPLE_SIZE = 100
+
+# Candidate formats tried against the first value of a text column
+_DATE_FORMATS = (
+    '%Y-%m-%d',
+    '%Y-%m-%d %H:%M:%S',
+    '%Y/%m/%d',
+    '%m/%d/%Y',
+    '%d/%m/%Y',
+    '%d-%m-%Y',
+)
 
 class DatabaseDialect(Enum):
     MYSQL = "mysql"
@@ -14,140 +56,407 @@ class DatabaseDialect(Enum):
     SQLITE = "sqlite"
     MSSQL = "mssql"
 
+@lru_cache(maxsize=None)
+def _varchar(length: int) -> str:
+    return f'VARCHAR({length})'
+
 class SQLTypeMapper:
     def __init__(self, dialect: DatabaseDialect):
         self.dialect = dialect
         
+        # Resolve the dialect once; the get_* methods are plain table lookups.
+        # Integer table: (exclusive upper bound, type), falling back to _int_default.
+        # Text table: (length above which, type), falling back to VARCHAR(n).
+        if dialect == DatabaseDialect.POSTGRESQL:
+            self._int_table = ((32767, 'SMALLINT'), (2147483647, 'INTEGER'))
+            self._int_default = 'BIGINT'
+            self._varchar_table = ((255, 'TEXT'),)
+            self._decimal_fmt = 'NUMERIC({precision},{scale})'
+            self._date_type = 'TIMESTAMP'
+        elif dialect == DatabaseDialect.MYSQL:
+            self._int_table = ((32767, 'SMALLINT'), (2147483647, 'INT'))
+            self._int_default = 'BIGINT'
+            self._varchar_table = ((65535, 'LONGTEXT'), (16383, 'MEDIUMTEXT'))
+            self._decimal_fmt = 'DECIMAL({precision},{scale})'
+            self._date_type = 'DATETIME'
+        else:  # Defaults for SQLite and others
+            self._int_table = ()
+            self._int_default = 'INTEGER'
+            self._varchar_table = ()
+            self._decimal_fmt = 'DECIMAL({precision},{scale})'
+            self._date_type = 'TIMESTAMP'
+        
     def get_integer_type(self, max_val: int) -> str:
-        if self.dialect == DatabaseDialect.POSTGRESQL:
-            if max_val < 32767:
-                return 'SMALLINT'
-            elif max_val < 2147483647:
-                return 'INTEGER'
-            return 'BIGINT'
-        elif self.dialect == DatabaseDialect.MYSQL:
-            if max_val < 32767:
-                return 'SMALLINT'
-            elif max_val < 2147483647:
-                return 'INT'
-            return 'BIGINT'
-        return 'INTEGER'  # Default for SQLite and others
+        return next(
+            (name for threshold, name in self._int_table if max_val < threshold),
+            self._int_default
+        )
         
     def get_decimal_type(self, precision: int = 18, scale: int = 2) -> str:
-        if self.dialect == DatabaseDialect.POSTGRESQL:
-            return f'NUMERIC({precision},{scale})'
-        return f'DECIMAL({precision},{scale})'
+        return self._decimal_fmt.format(precision=precision, scale=scale)
         
     def get_varchar_type(self, length: int) -> str:
-        if self.dialect == DatabaseDialect.POSTGRESQL:
-            if length > 255:
-                return 'TEXT'
-            return f'VARCHAR({length})'
-        elif self.dialect == DatabaseDialect.MYSQL:
-            if length > 65535:
-                return 'LONGTEXT'
-            elif length > 16383:
-                return 'MEDIUMTEXT'
-            return f'VARCHAR({length})'
-        return f'VARCHAR({length})'  # Default for others
+        for threshold, name in self._varchar_table:
+            if length > threshold:
+                return name
+        return _varchar(length)
         
     def get_date_type(self) -> str:
-        if self.dialect == DatabaseDialect.POSTGRESQL:
-            return 'TIMESTAMP'
-        elif self.dialect == DatabaseDialect.MYSQL:
-            return 'DATETIME'
-        return 'TIMESTAMP'
+        return self._date_type
 
-def analyze_column_data(df: pd.DataFrame, dialect: DatabaseDialect = DatabaseDialect.POSTGRESQL) -> Dict[str, Tuple[str, Dict]]:
+def guess_date_format(value) -> str:
     """
-    Analyze DataFrame columns and suggest SQL data types with additional metadata.
-    Returns a dictionary of column names and their suggested SQL types plus metadata.
+    Guess a strptime format for a single value, falling back to 'mixed'.
     """
-    sql_types = {}
-    type_mapper = SQLTypeMapper(dialect)
+    for fmt in _DATE_FORMATS:
+        try:
+            datetime.strptime(str(value), fmt)
+            return fmt
+        except ValueError:
+            continue
+    return 'mixed'
+
+def parse_dates(values: pd.Series) -> pd.Series:
+    """
+    Parse values as dates using a format sniffed from the first value, so one column
+    can't mix layouts. Values with no known format are parsed one by one.
+    Raises ValueError or TypeError at the first value that isn't a date.
+    """
+    return pd.to_datetime(values, format=guess_date_format(values.iloc[0]))
+
+def string_lengths(values: pd.Series) -> np.ndarray:
+    """
+    Return the length of each value's string form as an int64 array.
+    """
+    return np.fromiter(
+        (len(str(x)) for x in values.to_numpy(dtype=object)),
+        dtype=np.int64,
+        count=len(values)
+    )
+
+def analyze_column(column, values: pd.Series, type_mapper: SQLTypeMapper) -> Tuple[str, str, Dict]:
+    """
+    Analyze a single column and suggest an SQL data type with additional metadata.
+    Returns the cleaned column name, the suggested SQL type and the metadata.
+    """
+    # Clean column name for SQL
+    clean_col_name = _NON_WORD_RE.sub('_', str(column)).lower().strip('_')
     
-    for column in df.columns:
-        # Clean column name for SQL
-        clean_col_name = re.sub(r'\W+', '_', str(column)).lower().strip('_')
-        
-        # Get non-null values
-        non_null_values = df[column].dropna()
-        null_count = df[column].isna().sum()
-        total_count = len(df[column])
+    # Get non-null values from a single null mask
+    null_mask = values.isna().to_numpy()
+    null_count = int(null_mask.sum())
+    total_count = len(null_mask)
+    non_null_values = values[~null_mask]
+    
+    metadata = {
+        'original_name': column,
+        'null_count': null_count,
+        'total_count': total_count,
+        'null_percentage': (null_count / total_count) * 100 if total_count > 0 else 0
+    }
+    
+    if len(non_null_values) == 0:
+        return clean_col_name, type_mapper.get_varchar_type(255), metadata
         
-        metadata = {
-            'original_name': column,
-            'null_count': null_count,
-            'total_count': total_count,
-            'null_percentage': (null_count / total_count) * 100 if total_count > 0 else 0
-        }
+    # Typed columns (e.g. from read_excel) don't need to be coerced
+    is_numeric = pd.api.types.is_numeric_dtype(non_null_values)
+    is_datetime = pd.api.types.is_datetime64_any_dtype(non_null_values)
+    
+    # Check if all values are numeric
+    if not is_datetime:
+        numeric_values = non_null_values
+        if not is_numeric:
+            # Fail fast: to_numeric stops at the first non-numeric value
+            try:
+                numeric_values = pd.to_numeric(non_null_values)
+            except (ValueError, TypeError):
+                numeric_values = None
         
-        if len(non_null_values) == 0:
-            sql_types[clean_col_name] = (type_mapper.get_varchar_type(255), metadata)
-            continue
-            
-        # Check if all values are numeric
-        try:
-            numeric_values = pd.to_numeric(non_null_values)
-            metadata['min_value'] = float(numeric_values.min())
-            metadata['max_value'] = float(numeric_values.max())
+        if numeric_values is not None:
+            vals = numeric_values.to_numpy(dtype=np.float64)
+            max_val = vals.max()
+            metadata['min_value'] = float(vals.min())
+            metadata['max_value'] = float(max_val)
             
-            if all(numeric_values.astype(int) == numeric_values):
-                max_val = numeric_values.max()
+            if np.isfinite(vals).all() and (np.mod(vals, 1) == 0).all():
                 sql_type = type_mapper.get_integer_type(max_val)
             else:
-                # Analyze decimal places
+                # Analyze decimal places; repeated values only need to be rendered once
                 decimal_places = max(
-                    len(str(x).split('.')[-1]) if '.' in str(x) else 0 
-                    for x in non_null_values
+                    len(text.split('.')[-1]) if '.' in text else 0
+                    for text in map(str, non_null_values.unique())
                 )
                 metadata['decimal_places'] = decimal_places
                 sql_type = type_mapper.get_decimal_type(18, decimal_places)
             
-            sql_types[clean_col_name] = (sql_type, metadata)
-            continue
-        except:
-            pass
+            return clean_col_name, sql_type, metadata
+    
+    # Check if all values are dates
+    if not is_numeric:
+        if is_datetime:
+            dates = non_null_values
+        else:
+            try:
+                # Reject non-date columns on a sample before parsing every row
+                parse_dates(non_null_values.head(_DATE_SAMPLE_SIZE))
+                dates = parse_dates(non_null_values)
+            except (ValueError, TypeError):
+                dates = None
         
-        # Check if all values are dates
-        try:
-            dates = pd.to_datetime(non_null_values)
+        if dates is not None:
             metadata['min_date'] = dates.min().strftime('%Y-%m-%d')
             metadata['max_date'] = dates.max().strftime('%Y-%m-%d')
-            sql_types[clean_col_name] = (type_mapper.get_date_type(), metadata)
-            continue
-        except:
-            pass
+            return clean_col_name, type_mapper.get_date_type(), metadata
+    
+    # Text analysis
+    str_lengths = string_lengths(non_null_values)
+    metadata['min_length'] = int(str_lengths.min())
+    metadata['max_length'] = int(str_lengths.max())
+    metadata['avg_length'] = float(str_lengths.mean())
+    
+    # Get appropriate VARCHAR length with 20% padding
+    max_length = int(metadata['max_length'] * 1.2)
+    return clean_col_name, type_mapper.get_varchar_type(max_length), metadata
+
+def analyze_column_data(df: pd.DataFrame, dialect: DatabaseDialect = DatabaseDialect.POSTGRESQL) -> Tuple[Dict[str, str], Dict[str, Dict]]:
+    """
+    Analyze DataFrame columns and suggest SQL data types with additional metadata.
+    Returns two dictionaries keyed by column name: suggested SQL types and metadata.
+    """
+    sql_types = {}
+    column_metadata = {}
+    type_mapper = SQLTypeMapper(dialect)
+    
+    # Columns are independent, so analyze them concurrently; map() keeps column order
+    with ThreadPoolExecutor() as executor:
+        results = executor.map(
+            analyze_column,
+            df.columns,
+            [df[column] for column in df.columns],
+            repeat(type_mapper)
+        )
+        for clean_col_name, sql_type, metadata in results:
+            sql_types[clean_col_name] = sql_type
+            column_metadata[clean_col_name] = metadata
+    
+    return sql_types, column_metadata
+
+def _trim_row(row: tuple) -> tuple:
+    """
+    Drop trailing empty cells, which unsized (e.g. write-only) sheets leave ragged.
+    """
+    width = len(row)
+    while width and row[width - 1] is None:
+        width -= 1
+    return row[:width]
+
+def _dedupe_names(names: List, unnamed: List[int] = ()) -> List:
+    """
+    Rename repeated column names to name.1, name.2, ... the way pd.read_excel does:
+    suffixes already taken by another header are skipped, and the unnamed columns
+    (given by index) are renamed after the named ones.
+    """
+    names = list(names)
+    counts = {}
+    for i in [i for i in range(len(names)) if i not in unnamed] + list(unnamed):
+        name = original = names[i]
+        count = counts.get(name, 0)
+        while count > 0:
+            counts[original] = count + 1
+            name = f'{original}.{count}'
+            count = count + 1 if name in names else counts.get(name, 0)
+        names[i] = name
+        counts[name] = count + 1
+    return names
+
+def iter_excel_chunks(excel_path: str, chunk_size: int = _CHUNK_SIZE, dtype=None):
+    """
+    Stream the first sheet of an Excel file as DataFrames of at most chunk_size rows.
+    Like pd.read_excel, the first row is the header (repeated names get a .n suffix),
+    the frame is as wide as the widest row (extra columns are named 'Unnamed: n') and
+    trailing empty rows are dropped. A sheet with only a header (or nothing at all)
+    yields one empty frame.
+    Pass dtype=object to keep the cell values as read instead of letting pandas infer.
+    """
+    workbook = load_workbook(excel_path, read_only=True, data_only=True)
+    try:
+        rows = workbook.worksheets[0].iter_rows(values_only=True)
+        # A blank header row leaves every column to be named 'Unnamed: n' below
+        header = _trim_row(next(rows, ()))
+        unnamed = [i for i, name in enumerate(header) if name is None or name == '']
+        columns = _dedupe_names([f'Unnamed: {i}' if i in unnamed else name for i, name in enumerate(header)], unnamed)
+        
+        def to_frame(chunk):
+            width = len(columns)
+            return pd.DataFrame([row + (None,) * (width - len(row)) for row in chunk], columns=columns, dtype=dtype)
         
-        # Text analysis
-        str_lengths = non_null_values.astype(str).str.len()
-        metadata['min_length'] = int(str_lengths.min())
-        metadata['max_length'] = int(str_lengths.max())
-        metadata['avg_length'] = float(str_lengths.mean())
+        chunk = []
+        empty_rows = 0
+        yielded = False
+        for row in rows:
+            row = _trim_row(row)
+            # Hold back empty rows until we know they aren't trailing
+            if not row:
+                empty_rows += 1
+                continue
+            chunk.extend([()] * empty_rows)
+            empty_rows = 0
+            if len(row) > len(columns):
+                columns = _dedupe_names(columns + [f'Unnamed: {i}' for i in range(len(columns), len(row))])
+            chunk.append(row)
+            if len(chunk) >= chunk_size:
+                yield to_frame(chunk)
+                yielded = True
+                chunk = []
+        if chunk or not yielded:
+            yield to_frame(chunk)
+    finally:
+        workbook.close()
+
+def _column_kind(metadata: Dict) -> Optional[str]:
+    """
+    Classify a column from the metadata keys analyze_column_data filled in.
+    """
+    if 'decimal_places' in metadata:
+        return 'decimal'
+    if 'min_value' in metadata:
+        return 'integer'
+    if 'min_date' in metadata:
+        return 'date'
+    if 'min_length' in metadata:
+        return 'text'
+    return None  # No non-null values
+
+def _merged_kind(kinds: set) -> Optional[str]:
+    """
+    Combine the kinds seen across chunks into the kind of the whole column.
+    """
+    if not kinds:
+        return None
+    if kinds <= {'integer', 'decimal'}:
+        return 'decimal' if 'decimal' in kinds else 'integer'
+    if kinds == {'date'}:
+        return 'date'
+    return 'text'
+
+def _merge_lengths(state: Dict, min_length: int, max_length: int, length_sum: float):
+    state['min_length'] = min(state.get('min_length', min_length), min_length)
+    state['max_length'] = max(state.get('max_length', max_length), max_length)
+    state['length_sum'] = state.get('length_sum', 0) + length_sum
+
+def analyze_excel_file(excel_path: str, dialect: DatabaseDialect = DatabaseDialect.POSTGRESQL, chunk_size: int = _CHUNK_SIZE) -> Tuple[Dict[str, str], Dict[str, Dict]]:
+    """
+    Analyze an Excel file chunk by chunk, merging per-column statistics as it goes.
+    Text lengths are only tracked for text chunks; columns whose chunks disagree on
+    the type are measured in a second pass over just those columns.
+    Returns the same (SQL types, metadata) pair as analyze_column_data.
+    """
+    stats = {}
+    rows_seen = 0
+    for chunk in iter_excel_chunks(excel_path, chunk_size):
+        _, chunk_metadata = analyze_column_data(chunk, dialect)
+        for clean_col_name, metadata in chunk_metadata.items():
+            # A column first seen in a later chunk was empty in every earlier row
+            state = stats.setdefault(clean_col_name, {
+                'original_name': metadata['original_name'],
+                'null_count': rows_seen,
+                'total_count': rows_seen,
+                'kinds': set(),
+            })
+            state['null_count'] += int(metadata['null_count'])
+            state['total_count'] += int(metadata['total_count'])
+            
+            kind = _column_kind(metadata)
+            if kind is None:
+                continue
+            state['kinds'].add(kind)
+            
+            if kind in ('integer', 'decimal'):
+                state['min_value'] = min(state.get('min_value', metadata['min_value']), metadata['min_value'])
+                state['max_value'] = max(state.get('max_value', metadata['max_value']), metadata['max_value'])
+                state['decimal_places'] = max(state.get('decimal_places', 0), metadata.get('decimal_places', 0))
+            elif kind == 'date':
+                state['min_date'] = min(state.get('min_date', metadata['min_date']), metadata['min_date'])
+                state['max_date'] = max(state.get('max_date', metadata['max_date']), metadata['max_date'])
+            elif kind == 'text':
+                non_null_count = int(metadata['total_count']) - int(metadata['null_count'])
+                _merge_lengths(state, metadata['min_length'], metadata['max_length'],
+                               metadata['avg_length'] * non_null_count)
+        rows_seen += len(chunk)
+    
+    # Columns that mix types across chunks are stored as text, but their non-text chunks
+    # have no length stats. Re-read the sheet once and measure the raw cells of just those.
+    mixed = [state for state in stats.values()
+             if _merged_kind(state['kinds']) == 'text' and state['kinds'] != {'text'}]
+    if mixed:
+        for state in mixed:
+            for key in ('min_length', 'max_length', 'length_sum'):
+                state.pop(key, None)
+        for chunk in iter_excel_chunks(excel_path, chunk_size, dtype=object):
+            for state in mixed:
+                # Columns only appear once a row is wide enough to reach them
+                if state['original_name'] not in chunk:
+                    continue
+                lengths = string_lengths(chunk[state['original_name']].dropna())
+                if len(lengths):
+                    _merge_lengths(state, int(lengths.min()), int(lengths.max()), int(lengths.sum()))
+    
+    # Derive SQL types from the merged statistics
+    sql_types = {}
+    column_metadata = {}
+    type_mapper = SQLTypeMapper(dialect)
+    
+    for clean_col_name, state in stats.items():
+        null_count, total_count = state['null_count'], state['total_count']
+        metadata = {
+            'original_name': state['original_name'],
+            'null_count': null_count,
+            'total_count': total_count,
+            'null_percentage': (null_count / total_count) * 100 if total_count > 0 else 0
+        }
+        column_metadata[clean_col_name] = metadata
+        kind = _merged_kind(state['kinds'])
         
-        # Get appropriate VARCHAR length with 20% padding
-        max_length = int(str_lengths.max() * 1.2)
-        sql_types[clean_col_name] = (type_mapper.get_varchar_type(max_length), metadata)
+        if kind is None:
+            sql_types[clean_col_name] = type_mapper.get_varchar_type(255)
+        elif kind in ('integer', 'decimal'):
+            metadata['min_value'] = state['min_value']
+            metadata['max_value'] = state['max_value']
+            if kind == 'decimal':
+                metadata['decimal_places'] = state['decimal_places']
+                sql_types[clean_col_name] = type_mapper.get_decimal_type(18, state['decimal_places'])
+            else:
+                sql_types[clean_col_name] = type_mapper.get_integer_type(state['max_value'])
+        elif kind == 'date':
+            metadata['min_date'] = state['min_date']
+            metadata['max_date'] = state['max_date']
+            sql_types[clean_col_name] = type_mapper.get_date_type()
+        else:
+            # Either every chunk was text or the chunks disagreed on the type
+            metadata['min_length'] = state['min_length']
+            metadata['max_length'] = state['max_length']
+            metadata['avg_length'] = state['length_sum'] / (total_count - null_count)
+            
+            # Get appropriate VARCHAR length with 20% padding
+            max_length = int(state['max_length'] * 1.2)
+            sql_types[clean_col_name] = type_mapper.get_varchar_type(max_length)
     
-    return sql_types
+    return sql_types, column_metadata
 
 def generate_sql_schema(excel_path: str, table_name: str, dialect: DatabaseDialect = DatabaseDialect.POSTGRESQL) -> Tuple[str, Dict]:
     """
     Generate SQL schema from Excel file with detailed column analysis.
     Returns both the SQL schema and column metadata.
     """
-    # Read Excel file
-    df = pd.read_excel(excel_path)
-    
-    # Analyze columns
-    column_analysis = analyze_column_data(df, dialect)
+    # Analyze columns, streaming the sheet so large files don't need to fit in memory
+    sql_types, column_metadata = analyze_excel_file(excel_path, dialect)
     
     # Generate CREATE TABLE statement
     create_table = f"CREATE TABLE {table_name} (\n"
     columns = []
     
-    for col, (sql_type, metadata) in column_analysis.items():
-        nullable = "NULL" if metadata['null_count'] > 0 else "NOT NULL"
+    for col, sql_type in sql_types.items():
+        nullable = "NULL" if column_metadata[col]['null_count'] > 0 else "NOT NULL"
         columns.append(f"    {col} {sql_type} {nullable}")
     
     create_table += ",\n".join(columns)
@@ -162,78 +471,101 @@ def generate_sql_schema(excel_path: str, table_name: str, dialect: DatabaseDiale
         f.write(create_table)
     
     # Save detailed analysis as JSON
-    import json
     analysis_path = os.path.join(base_path, 'column_analysis.json')
-    analysis_dict = {col: metadata for col, (_, metadata) in column_analysis.items()}
     with open(analysis_path, 'w') as f:
-        json.dump(analysis_dict, f, indent=2)
+        json.dump(column_metadata, f, indent=2)
     
-    return create_table, column_analysis
+    return create_table, column_metadata
 
-def copy_text_and_style(worksheet, cell_address, paragraph):
+class _StreamedStory:
     """
-    Copy text and basic style from a Word paragraph to an Excel cell.
+    Stand-in parent for paragraphs and tables parsed outside of a Document.
+    python-docx only reaches through it to resolve paragraph styles.
     """
-    cell = worksheet[cell_address]
-    cell.value = paragraph.text
+    def __init__(self, styles: Styles):
+        self._styles = styles
+
+    @property
+    def part(self):
+        return self
+
+    def get_style(self, style_id, style_type):
+        return self._styles.get_by_id(style_id, style_type)
+
+def load_styles(docx_zip: zipfile.ZipFile) -> Styles:
+    """
+    Load the style definitions of a .docx without parsing its main document.
+    """
+    try:
+        styles_xml = docx_zip.read('word/styles.xml')
+    except KeyError:
+        return StylesPart.default(None).styles
+    return Styles(parse_xml(styles_xml))
+
+def iter_body_elements(docx_zip: zipfile.ZipFile):
+    """
+    Stream the top-level paragraphs and tables of word/document.xml.
+    Each element is cleared once the caller moves on, so memory stays bounded by
+    the largest single element instead of the whole document.
+    """
+    with docx_zip.open('word/document.xml') as document_xml:
+        context = etree.iterparse(document_xml, events=('end',), tag=(_P_TAG, _TBL_TAG))
+        context.set_element_class_lookup(element_class_lookup)
+        for _, element in context:
+            # Paragraphs and tables nested in a table are copied with that table
+            if element.getparent().tag != _BODY_TAG:
+                continue
+            yield element
+            element.clear(keep_tail=True)
+            while element.getprevious() is not None:
+                del element.getparent()[0]
+
+def copy_text_and_style(worksheet, paragraph):
+    """
+    Copy text and basic style from a Word paragraph to a new row of a write-only worksheet.
+    """
+    cell = WriteOnlyCell(worksheet, value=paragraph.text)
 
     # Apply basic formatting
-    cell.font = Font(name='Calibri', size=11)
+    cell.font = DEFAULT_FONT
     if paragraph.style.font.bold:
-        cell.font = Font(bold=True)
+        cell.font = BOLD_FONT
     if paragraph.style.font.italic:
-        cell.font = Font(italic=True)
-    cell.alignment = Alignment(horizontal='left', wrap_text=True)
+        cell.font = ITALIC_FONT
+    cell.alignment = LEFT_WRAP
+    worksheet.append([cell])
 
-def copy_table_to_excel(worksheet, start_row, table):
+def copy_table_to_excel(worksheet, table):
     """
-    Copy a Word table to an Excel worksheet starting at the specified row.
+    Append a Word table to a write-only worksheet, one row per table row.
     """
-    current_row = start_row
     for row in table.rows:
-        current_col = 1
+        row_cells = []
         for cell in row.cells:
-            excel_cell = worksheet.cell(row=current_row, column=current_col)
-            excel_cell.value = cell.text
-            excel_cell.alignment = Alignment(horizontal='left', wrap_text=True)
-            current_col += 1
-        current_row += 1
-    return current_row
+            excel_cell = WriteOnlyCell(worksheet, value=cell.text)
+            excel_cell.alignment = LEFT_WRAP
+            row_cells.append(excel_cell)
+        worksheet.append(row_cells)
 
 def export_word_to_excel(word_path, excel_path):
     """
     Export content from a Word document to an Excel file.
     """
-    # Load Word document
-    doc = Document(word_path)
-
-    # Create Excel workbook and worksheet
-    workbook = Workbook()
-    worksheet = workbook.active
-    worksheet.title = "WordToExcel"
+    # Create a streaming Excel workbook; rows are appended in document order
+    workbook = Workbook(write_only=True)
+    worksheet = workbook.create_sheet("WordToExcel")
 
-    row = 1
-
-    # Loop through elements in the Word document
-    for element in doc.element.body:
-        if element.tag.endswith('p'):  # Paragraph
-            try:
-                # Safely access paragraph if it exists
-                paragraph = doc.paragraphs[row - 1] if row - 1 < len(doc.paragraphs) else None
-                if paragraph and paragraph.text.strip():  # Ensure paragraph exists and is not empty
-                    cell_address = f"A{row}"
-                    copy_text_and_style(worksheet, cell_address, paragraph)
-                    row += 1
-            except IndexError as e:
-                print(f"Skipping invalid paragraph at index {row - 1}: {e}")
-        elif element.tag.endswith('tbl'):  # Table
-            # Get the table object
-            try:
-                table = next((t for t in doc.tables if t._element == element), None)
-                if table:
-                    row = copy_table_to_excel(worksheet, row, table)
-            except Exception as e:
-                print(f"Skipping invalid table: {e}")
+    # Stream elements from the Word document instead of loading it whole
+    with zipfile.ZipFile(word_path) as docx_zip:
+        story = _StreamedStory(load_styles(docx_zip))
+        for element in iter_body_elements(docx_zip):
+            if element.tag == _P_TAG:  # Paragraph
+                paragraph = Paragraph(element, story)
+                if paragraph.text.strip():  # Skip empty paragraphs
+                    copy_text_and_style(worksheet, paragraph)
+            elif element.tag == _TBL_TAG:  # Table
+                table = Table(element, story)
+                copy_table_to_excel(worksheet, table)
 
     # Ensure the output directory exists
     output_dir = os.path.dirname(excel_path)
@@ -243,23 +575,24 @@ def export_word_to_excel(word_path, excel_path):
     # Save Excel file
     workbook.save(excel_path)
 
-# Paths
-word_file_path = "/Users/mutai/Desktop/KERICHO_COUNTY_FINANCE.docx"
-excel_file_path = "output/WordToExcel.xlsx"
+if __name__ == '__main__':
+    # Paths
+    word_file_path = "/Users/mutai/Desktop/KERICHO_COUNTY_FINANCE.docx"
+    excel_file_path = "output/WordToExcel.xlsx"
 
-# Export the Word document to Excel
-export_word_to_excel(word_file_path, excel_file_path)
+    # Export the Word document to Excel
+    export_word_to_excel(word_file_path, excel_file_path)
 
-# Generate SQL schema for PostgreSQL (default)
-table_name = "kericho_county_finance"
-sql_schema, column_analysis = generate_sql_schema(excel_file_path, table_name)
+    # Generate SQL schema for PostgreSQL (default)
+    table_name = "kericho_county_finance"
+    sql_schema, column_analysis = generate_sql_schema(excel_file_path, table_name)
 
-print("\nGenerated PostgreSQL Schema:")
-print(sql_schema)
+    print("\nGenerated PostgreSQL Schema:")
+    print(sql_schema)
 
-# Also generate MySQL version
-mysql_schema, _ = generate_sql_schema(excel_file_path, table_name, DatabaseDialect.MYSQL)
-print("\nGenerated MySQL Schema:")
-print(mysql_schema)
+    # Also generate MySQL version
+    mysql_schema, _ = generate_sql_schema(excel_file_path, table_name, DatabaseDialect.MYSQL)
+    print("\nGenerated MySQL Schema:")
+    print(mysql_schema)
 
-print("\nDetailed column analysis has been saved to 'column_analysis.json'")
+    print("\nDetailed column analysis has been saved to 'column_analysis.json'")
@@ -0,0 +1,91 @@
+import pandas as pd
+import pytest
+from openpyxl import Workbook
+
+from convert import analyze_column_data, analyze_excel_file, iter_excel_chunks
+
+
+def write_sheet(path, rows):
+    # Write-only sheets are unsized, so ragged rows come back ragged
+    workbook = Workbook(write_only=True)
+    worksheet = workbook.create_sheet()
+    for row in rows:
+        worksheet.append(row)
+    workbook.save(path)
+    return str(path)
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 3, 100])
+def test_chunked_analysis_matches_whole_sheet(tmp_path, chunk_size):
+    path = write_sheet(tmp_path / 'data.xlsx', [
+        ('id', 'price', 'name', 'joined'),
+        (1, 1.5, 'ann', '2020-01-02'),
+        (2, 20.25, 'bob', '2020-03-04'),
+        (3, None, 'carolina', '2021-12-31'),
+        (4, 3.0, None, '2019-06-07'),
+    ])
+    expected = analyze_column_data(pd.read_excel(path))[0]
+    assert analyze_excel_file(path, chunk_size=chunk_size)[0] == expected
+
+
+def test_column_flipping_to_text_is_measured_as_text(tmp_path):
+    path = write_sheet(tmp_path / 'data.xlsx', [('code',), (1,), (22,), ('abcdefghij',)])
+    sql_types, metadata = analyze_excel_file(path, chunk_size=2)
+    assert sql_types == {'code': 'VARCHAR(12)'}
+    assert metadata['code']['min_length'] == 1
+    assert metadata['code']['max_length'] == 10
+
+
+def test_mixed_column_first_seen_in_later_chunk(tmp_path):
+    rows = [('x',), (1,), (2,), (3,), (4, 5), (5, 6), (6, 7), (7, 'abc'), (8, 'd'), (9, 'e')]
+    path = write_sheet(tmp_path / 'data.xlsx', rows)
+    sql_types, metadata = analyze_excel_file(path, chunk_size=3)
+    assert sql_types['unnamed_1'] == 'VARCHAR(3)'
+    assert metadata['unnamed_1']['null_count'] == 3
+    assert metadata['unnamed_1']['max_length'] == 3
+
+
+def test_header_only_sheet(tmp_path):
+    path = write_sheet(tmp_path / 'data.xlsx', [('a', 'b')])
+    chunks = list(iter_excel_chunks(path))
+    assert len(chunks) == 1
+    assert list(chunks[0].columns) == ['a', 'b']
+    assert chunks[0].empty
+
+
+@pytest.mark.parametrize('rows', [
+    [(), (1, 'a'), (2, 'b')],
+    [(), (), (1, 'a')],
+    [(), (1,), (2, 'b', 3)],
+])
+def test_blank_header_row_gives_unnamed_columns(tmp_path, rows):
+    path = write_sheet(tmp_path / 'data.xlsx', rows)
+    expected = pd.read_excel(path)
+    chunk, = iter_excel_chunks(path)
+    assert list(chunk.columns) == list(expected.columns)
+    assert analyze_excel_file(path)[0] == analyze_column_data(expected)[0]
+
+
+@pytest.mark.parametrize('header', [
+    ('a', 'a', 'a'),
+    ('a', 'a', 'a.1'),
+    ('a', 'a.1', 'a', 'a'),
+    ('a', 'a.1', 'a.1', 'a'),
+    (None, 'Unnamed: 0', 'b'),
+    ('Unnamed: 2', 'a', None),
+])
+def test_repeated_header_names_match_read_excel(tmp_path, header):
+    path = write_sheet(tmp_path / 'data.xlsx', [header, tuple(range(len(header)))])
+    chunk, = iter_excel_chunks(path)
+    assert list(chunk.columns) == list(pd.read_excel(path).columns)
+
+
+@pytest.mark.parametrize('values, expected', [
+    (['2020-01-02', '2021-03-13'], 'TIMESTAMP'),
+    (['Jan 5 2021', '2020-01-02'], 'TIMESTAMP'),
+    (['01/02/2020', '13/03/2021'], 'VARCHAR(12)'),
+    (['2020-01-02', 'Jan 5 2021'], 'VARCHAR(12)'),
+])
+def test_dates_must_share_the_guessed_format(values, expected):
+    sql_types, _ = analyze_column_data(pd.DataFrame({'when': values}, dtype=object))
+    assert sql_types['when'] == expected